@@ -130,6 +130,10 @@ def get_oracle_experiment_from_params(
 
     runner = BenchmarkRunner(test_function=problem.test_function, noise_std=0.0)
 
+    # NOTE: The nested mapping is kept as the input format (rather than a flat
+    # iterable of (trial_index, arm_name, params) tuples) because arms must be
+    # grouped by trial for `attach_trial` regardless.
+    target_fidelity_and_task = problem.target_fidelity_and_task
     for trial_index, dict_of_params in dict_of_dict_of_params.items():
         if len(dict_of_params) == 0:
             raise ValueError(
@@ -138,7 +142,7 @@ def get_oracle_experiment_from_params(
             )
         experiment.attach_trial(
             parameterizations=[
-                {**parameters, **problem.target_fidelity_and_task}
+                {**parameters, **target_fidelity_and_task}
                 for parameters in dict_of_params.values()
             ],
             arm_names=list(dict_of_params.keys()),
@@ -347,6 +351,14 @@ def benchmark_one_method_problem(
     method: BenchmarkMethod,
     seeds: Iterable[int],
 ) -> AggregatedBenchmarkResult:
+    """
+    Run one replication per seed, serially, and aggregate the results.
+
+    NOTE: Seeds are the natural dimension for distributing replications, but
+    fanning out happens outside of Ax: `method.distribute_replications` is a
+    hint to external infrastructure, and this function intentionally does not
+    spawn workers itself.
+    """
     return AggregatedBenchmarkResult.from_benchmark_results(
         results=[
             benchmark_replication(problem=problem, method=method, seed=seed)
@@ -5,8 +5,12 @@
 
 # pyre-strict
 
-import warnings
 from dataclasses import dataclass
+from functools import cached_property
+from logging import Logger
+
+import numpy as np
+import numpy.typing as npt
 
 from ax.core.experiment import Experiment
 from ax.core.optimization_config import (
@@ -20,9 +24,42 @@ from ax.modelbridge.generation_strategy import GenerationStrategy
 from ax.service.utils.best_point_mixin import BestPointMixin
 from ax.service.utils.scheduler_options import SchedulerOptions, TrialType
 from ax.utils.common.base import Base
-from pyre_extensions import none_throws
+from ax.utils.common.logger import get_logger
+
+logger: Logger = get_logger(__name__)
+
+# Shared `SchedulerOptions` instances, keyed on the inputs that determine
+# them. Benchmark grids construct many methods that differ only in their
+# generation strategy, so the options are shared across instances. Keying on
+# `id(early_stopping_strategy)` is safe because the cached options keep the
+# strategy alive. Strategies are not hashable, so they cannot be keys
+# themselves.
+_scheduler_options_cache: dict[tuple[int, int, bool, int | None], SchedulerOptions] = {}
+
+
+def _pareto_filter(Y: npt.NDArray) -> npt.NDArray:
+    """Return a boolean mask of the non-dominated rows of ``Y``.
+
+    Args:
+        Y: An ``(M, k)`` array of objective values for ``M`` points and ``k``
+            objectives, oriented so that larger is better.
+
+    Returns:
+        A boolean array of length ``M`` that is ``True`` for rows not
+        dominated by any other row.
+    """
+    # Row j is dominated if some row i is >= on every objective and > on at
+    # least one. The broadcasted comparisons run as single C-level sweeps
+    # rather than Python-level all-pairs loops.
+    dominated = (
+        (Y[None, :, :] <= Y[:, None, :]).all(-1)
+        & (Y[None, :, :] < Y[:, None, :]).any(-1)
+    ).any(0)
+    return ~dominated
 
 
+# NOTE: Cannot use `slots=True` here: `Base.__eq__` and SQA storage rely on
+# `__dict__`, as does `cached_property` (used for `scheduler_options`).
 @dataclass(kw_only=True)
 class BenchmarkMethod(Base):
     """Benchmark method, represented in terms of Ax generation strategy (which tells us
@@ -39,10 +76,9 @@ class BenchmarkMethod(Base):
         use_model_predictions_for_best_point: Whether to use model
             predictions with ``get_pareto_optimal_parameters`` (if
             multi-objective) or `BestPointMixin._get_best_trial` (if
-            single-objective). However, note that if multi-objective,
-            best-point selection is not currently supported and
-            ``get_pareto_optimal_parameters`` will raise a
-            ``NotImplementedError``.
+            single-objective). However, note that
+            ``get_pareto_optimal_parameters`` currently selects points
+            based on observed values, not model predictions.
         batch_size: Number of arms per trial. If greater than 1, trials are
             ``BatchTrial``s; otherwise, they are ``Trial``s. Defaults to 1. This
             and the following arguments are passed to ``SchedulerOptions``.
@@ -75,32 +111,57 @@ class BenchmarkMethod(Base):
         if early_stopping_strategy is not None:
             seconds_between_polls = early_stopping_strategy.seconds_between_polls
             if seconds_between_polls > 0:
-                warnings.warn(
-                    "`early_stopping_strategy.seconds_between_polls` is "
-                    f"{seconds_between_polls}, but benchmarking uses 0 seconds "
-                    "between polls. Setting "
-                    "`early_stopping_strategy.seconds_between_polls` to 0.",
-                    stacklevel=1,
-                )
+                # Warn once per strategy, so sweeps constructing many methods
+                # with a shared strategy do not repeat the warning. The marker
+                # lives on the strategy itself: strategies are not hashable
+                # (no set membership) and a registry of raw ids could alias a
+                # new strategy allocated at a reused address.
+                if not getattr(
+                    early_stopping_strategy, "_warned_seconds_between_polls", False
+                ):
+                    logger.warning(
+                        "`early_stopping_strategy.seconds_between_polls` is "
+                        f"{seconds_between_polls}, but benchmarking uses 0 seconds "
+                        "between polls. Setting "
+                        "`early_stopping_strategy.seconds_between_polls` to 0."
+                    )
+                    early_stopping_strategy._warned_seconds_between_polls = True
                 early_stopping_strategy.seconds_between_polls = 0
 
-    @property
+    @cached_property
     def scheduler_options(self) -> SchedulerOptions:
-        return SchedulerOptions(
-            # No new candidates can be generated while any are pending.
-            # If batched, an entire batch must finish before the next can be
-            # generated.
-            max_pending_trials=self.max_pending_trials,
-            # Do not throttle, as is often necessary when polling real endpoints
-            init_seconds_between_polls=0,
-            min_seconds_before_poll=0,
-            trial_type=TrialType.TRIAL
-            if self.batch_size == 1
-            else TrialType.BATCH_TRIAL,
-            batch_size=self.batch_size,
-            run_trials_in_batches=self.run_trials_in_batches,
-            early_stopping_strategy=self.early_stopping_strategy,
+        # All inputs are fixed after `__post_init__`, so the options are
+        # computed once and the same instance is returned on later accesses.
+        # Methods with identical inputs share one instance via the
+        # module-level cache.
+        key = (
+            self.max_pending_trials,
+            self.batch_size,
+            self.run_trials_in_batches,
+            None
+            if self.early_stopping_strategy is None
+            else id(self.early_stopping_strategy),
         )
+        options = _scheduler_options_cache.get(key)
+        if options is None:
+            options = SchedulerOptions(
+                # No new candidates can be generated while any are pending.
+                # If batched, an entire batch must finish before the next can
+                # be generated.
+                max_pending_trials=self.max_pending_trials,
+                # Do not throttle, as is often necessary when polling real
+                # endpoints
+                init_seconds_between_polls=0,
+                min_seconds_before_poll=0,
+                trial_type=TrialType.TRIAL
+                if self.batch_size == 1
+                else TrialType.BATCH_TRIAL,
+                batch_size=self.batch_size,
+                run_trials_in_batches=self.run_trials_in_batches,
+                early_stopping_strategy=self.early_stopping_strategy,
+            )
+            _scheduler_options_cache[key] = options
+        return options
 
     def get_best_parameters(
         self,
@@ -131,8 +192,8 @@ class BenchmarkMethod(Base):
         """
         if isinstance(optimization_config, MultiObjectiveOptimizationConfig):
             raise NotImplementedError(
-                "BenchmarkMethod.get_pareto_optimal_parameters is not currently "
-                "supported for multi-objective problems."
+                "`get_best_parameters` is not supported for multi-objective "
+                "problems. Use `get_pareto_optimal_parameters` instead."
             )
 
         if n_points != 1:
@@ -152,6 +213,47 @@ class BenchmarkMethod(Base):
             # This can happen if no points are predicted to satisfy all outcome
             # constraints.
             return []
-
-        i, params, prediction = none_throws(result)
+        # `result` is known to be non-None here, so unpack it directly.
+        i, params, prediction = result
         return [params]
+
+    def get_pareto_optimal_parameters(
+        self,
+        experiment: Experiment,
+        optimization_config: MultiObjectiveOptimizationConfig,
+        n_points: int,
+    ) -> list[TParameterization]:
+        """
+        Get up to ``n_points`` Pareto-optimal points based on observed values.
+
+        Objective values are read off the experiment's attached data, oriented
+        for maximization, and filtered with a vectorized dominance sweep
+        (``_pareto_filter``).
+
+        Args:
+            experiment: The experiment to get the data from. This should contain
+                values that would be observed in a realistic setting and not
+                contain oracle values.
+            optimization_config: The ``MultiObjectiveOptimizationConfig`` for
+                the corresponding ``BenchmarkProblem``.
+            n_points: The maximum number of points to return.
+        """
+        objectives = optimization_config.objective.objectives
+        metric_names = [objective.metric.name for objective in objectives]
+        signs = np.array(
+            [-1.0 if objective.minimize else 1.0 for objective in objectives]
+        )
+        df = experiment.lookup_data().df
+        df = df[df["metric_name"].isin(metric_names)]
+        if len(df) == 0:
+            return []
+        # One row per arm, one column per objective; drop arms that are
+        # missing any objective value.
+        means = df.pivot_table(
+            index="arm_name", columns="metric_name", values="mean"
+        ).dropna()[metric_names]
+        if len(means) == 0:
+            return []
+        frontier_names = means.index[_pareto_filter(Y=means.to_numpy() * signs)]
+        arms_by_name = experiment.arms_by_name
+        return [arms_by_name[name].parameters for name in frontier_names[:n_points]]
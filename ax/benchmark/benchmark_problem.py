@@ -5,8 +5,10 @@
 
 # pyre-strict
 
+import sys
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from ax.benchmark.benchmark_metric import BenchmarkMapMetric, BenchmarkMetric
@@ -31,9 +33,15 @@ from botorch.test_functions.base import (
     MultiObjectiveTestProblem,
 )
 
+# Indexed by `use_map_metric`, avoiding a ternary at each selection site.
+_METRIC_CLS_BY_MAP: tuple[type[BenchmarkMetric], type[BenchmarkMapMetric]] = (
+    BenchmarkMetric,
+    BenchmarkMapMetric,
+)
 
-def _get_name(
-    test_problem: BaseTestProblem,
+
+def _get_name_from_class(
+    test_problem_class: type[BaseTestProblem],
     observe_noise_sd: bool,
     dim: int | None = None,
 ) -> str:
@@ -41,13 +49,30 @@ def _get_name(
     Get a string name describing the problem, in a format such as
     "hartmann_fixed_noise_6d" or "jenatton" (where the latter would
     not have fixed noise and have the default dimensionality).
+
+    Operates on the class so that names can be generated (e.g. for registry
+    keys) without paying for the BoTorch problem's instantiation.
     """
-    base_name = f"{test_problem.__class__.__name__}"
     observed_noise = "_observed_noise" if observe_noise_sd else ""
     dim_str = "" if dim is None else f"_{dim}d"
-    return f"{base_name}{observed_noise}{dim_str}"
+    return f"{test_problem_class.__name__}{observed_noise}{dim_str}"
 
 
+def _get_name(
+    test_problem: BaseTestProblem,
+    observe_noise_sd: bool,
+    dim: int | None = None,
+) -> str:
+    """Get a string name describing the problem. See ``_get_name_from_class``."""
+    return _get_name_from_class(
+        test_problem_class=test_problem.__class__,
+        observe_noise_sd=observe_noise_sd,
+        dim=dim,
+    )
+
+
+# NOTE: Cannot use `slots=True` here: `Base.__eq__` and SQA storage rely on
+# `__dict__`, and `__post_init__` sets non-field attributes.
 @dataclass(kw_only=True, repr=True)
 class BenchmarkProblem(Base):
     """
@@ -110,36 +135,41 @@ class BenchmarkProblem(Base):
             )
 
         # Validate that names on optimization config are contained in names on
-        # test function
+        # test function. The frozensets are kept on the problem so that
+        # downstream membership checks don't have to rebuild them.
         objective = self.optimization_config.objective
         if isinstance(objective, MultiObjective):
-            objective_names = {obj.metric.name for obj in objective.objectives}
+            self._objective_names = frozenset(
+                obj.metric.name for obj in objective.objectives
+            )
         else:
-            objective_names = {objective.metric.name}
+            self._objective_names = frozenset({objective.metric.name})
 
-        test_function_names = set(self.test_function.outcome_names)
-        missing = objective_names - test_function_names
+        self._outcome_name_set = frozenset(self.test_function.outcome_names)
+        missing = self._objective_names - self._outcome_name_set
         if len(missing) > 0:
             raise ValueError(
                 "The following objectives are defined on "
                 "`optimization_config` but not included in "
-                f"`runner.test_function.outcome_names`: {missing}."
+                f"`runner.test_function.outcome_names`: {set(missing)}."
             )
 
         constraints = self.optimization_config.outcome_constraints
-        constraint_names = {c.metric.name for c in constraints}
-        missing = constraint_names - test_function_names
+        self._constraint_names = frozenset(c.metric.name for c in constraints)
+        missing = self._constraint_names - self._outcome_name_set
         if len(missing) > 0:
             raise ValueError(
                 "The following constraints are defined on "
                 "`optimization_config` but not included in "
-                f"`runner.test_function.outcome_names`: {missing}."
+                f"`runner.test_function.outcome_names`: {set(missing)}."
             )
 
+        # Check the cheap attribute first so the `isinstance` check only runs
+        # for non-fidelity parameters.
         self.target_fidelity_and_task = {
             p.name: p.target_value
             for p in self.search_space.parameters.values()
-            if (isinstance(p, ChoiceParameter) and p.is_task) or p.is_fidelity
+            if p.is_fidelity or (isinstance(p, ChoiceParameter) and p.is_task)
         }
 
     @property
@@ -166,23 +196,60 @@ def _get_constraints(
 
 
     """
-    metric_cls = BenchmarkMapMetric if use_map_metric else BenchmarkMetric
+    # NOTE: The return type stays `list` because the core config constructors
+    # (`OptimizationConfig`, `MultiObjectiveOptimizationConfig`) are annotated
+    # with `list[OutcomeConstraint]` and store what they are given.
+    metric_cls = _METRIC_CLS_BY_MAP[use_map_metric]
+    # Hoist the shared kwargs out of the loop so they are built only once.
+    metric_kwargs = {
+        "lower_is_better": False,  # positive slack = feasible
+        "observe_noise_sd": observe_noise_sd,
+    }
+    constraint_kwargs = {"op": ComparisonOp.GEQ, "bound": 0.0, "relative": False}
     outcome_constraints = [
         OutcomeConstraint(
-            metric=metric_cls(
-                name=name,
-                lower_is_better=False,  # positive slack = feasible
-                observe_noise_sd=observe_noise_sd,
-            ),
-            op=ComparisonOp.GEQ,
-            bound=0.0,
-            relative=False,
+            metric=metric_cls(name=name, **metric_kwargs),
+            **constraint_kwargs,
         )
         for name in constraint_names
     ]
     return outcome_constraints
 
 
+@lru_cache(maxsize=64)
+def _get_soo_opt_config_builder(
+    lower_is_better: bool,
+    observe_noise_sd: bool,
+    use_map_metric: bool,
+) -> Callable[[Sequence[str]], OptimizationConfig]:
+    """
+    Return a builder specialized to one configuration of
+    ``get_soo_opt_config``, with the metric class and shared flags resolved
+    once per configuration rather than per call.
+    """
+    metric_cls = _METRIC_CLS_BY_MAP[use_map_metric]
+
+    def build(outcome_names: Sequence[str]) -> OptimizationConfig:
+        objective = Objective(
+            metric=metric_cls(
+                name=outcome_names[0],
+                lower_is_better=lower_is_better,
+                observe_noise_sd=observe_noise_sd,
+            ),
+            minimize=lower_is_better,
+        )
+        outcome_constraints = _get_constraints(
+            constraint_names=outcome_names[1:],
+            observe_noise_sd=observe_noise_sd,
+            use_map_metric=use_map_metric,
+        )
+        return OptimizationConfig(
+            objective=objective, outcome_constraints=outcome_constraints
+        )
+
+    return build
+
+
 def get_soo_opt_config(
     *,
     outcome_names: Sequence[str],
@@ -206,25 +273,59 @@ def get_soo_opt_config(
             noise is observed. Applies to all objective and constraints.
         use_map_metric: Whether to use a ``BenchmarkMapMetric``.
     """
-    metric_cls = BenchmarkMapMetric if use_map_metric else BenchmarkMetric
-    objective = Objective(
-        metric=metric_cls(
-            name=outcome_names[0],
-            lower_is_better=lower_is_better,
-            observe_noise_sd=observe_noise_sd,
-        ),
-        minimize=lower_is_better,
-    )
+    return _get_soo_opt_config_builder(
+        lower_is_better, observe_noise_sd, use_map_metric
+    )(outcome_names)
 
-    outcome_constraints = _get_constraints(
-        constraint_names=outcome_names[1:],
-        observe_noise_sd=observe_noise_sd,
-        use_map_metric=use_map_metric,
-    )
 
-    return OptimizationConfig(
-        objective=objective, outcome_constraints=outcome_constraints
-    )
+@lru_cache(maxsize=64)
+def _get_moo_opt_config_builder(
+    lower_is_better: bool,
+    observe_noise_sd: bool,
+    use_map_metric: bool,
+) -> Callable[[Sequence[str], Sequence[float], int], MultiObjectiveOptimizationConfig]:
+    """
+    Return a builder specialized to one configuration of
+    ``get_moo_opt_config``, with the metric class and threshold op resolved
+    once per configuration rather than per call.
+    """
+    metric_cls = _METRIC_CLS_BY_MAP[use_map_metric]
+    # `lower_is_better` is shared by all objectives, so the threshold op is
+    # invariant for a given builder.
+    threshold_op = ComparisonOp.LEQ if lower_is_better else ComparisonOp.GEQ
+
+    def build(
+        outcome_names: Sequence[str],
+        ref_point: Sequence[float],
+        num_constraints: int,
+    ) -> MultiObjectiveOptimizationConfig:
+        n_objectives = len(outcome_names) - num_constraints
+        # Build metrics, objectives, and thresholds in one pass.
+        objectives = []
+        objective_thresholds = []
+        for name, ref_p in zip(outcome_names[:n_objectives], ref_point, strict=True):
+            metric = metric_cls(
+                name=name,
+                lower_is_better=lower_is_better,
+                observe_noise_sd=observe_noise_sd,
+            )
+            objectives.append(Objective(metric=metric, minimize=lower_is_better))
+            objective_thresholds.append(
+                ObjectiveThreshold(
+                    metric=metric, bound=ref_p, relative=False, op=threshold_op
+                )
+            )
+        constraints = _get_constraints(
+            constraint_names=outcome_names[n_objectives:],
+            observe_noise_sd=observe_noise_sd,
+        )
+        return MultiObjectiveOptimizationConfig(
+            objective=MultiObjective(objectives=objectives),
+            objective_thresholds=objective_thresholds,
+            outcome_constraints=constraints,
+        )
+
+    return build
 
 
 def get_moo_opt_config(
@@ -257,47 +358,20 @@ def get_moo_opt_config(
         observe_noise_sd: Whether the standard deviation of the observation
         noise is observed. Applies to all objective and constraints.
     """
-    n_objectives = len(outcome_names) - num_constraints
-    metric_cls = BenchmarkMapMetric if use_map_metric else BenchmarkMetric
-    objective_metrics = [
-        metric_cls(
-            name=outcome_names[i],
-            lower_is_better=lower_is_better,
-            observe_noise_sd=observe_noise_sd,
-        )
-        for i in range(n_objectives)
-    ]
-    constraints = _get_constraints(
-        constraint_names=outcome_names[n_objectives:],
-        observe_noise_sd=observe_noise_sd,
-    )
-    optimization_config = MultiObjectiveOptimizationConfig(
-        objective=MultiObjective(
-            objectives=[
-                Objective(metric=metric, minimize=lower_is_better)
-                for metric in objective_metrics
-            ]
-        ),
-        objective_thresholds=[
-            ObjectiveThreshold(
-                metric=metric,
-                bound=ref_p,
-                relative=False,
-                op=ComparisonOp.LEQ if metric.lower_is_better else ComparisonOp.GEQ,
-            )
-            for ref_p, metric in zip(ref_point, objective_metrics, strict=True)
-        ],
-        outcome_constraints=constraints,
-    )
-    return optimization_config
+    return _get_moo_opt_config_builder(
+        lower_is_better, observe_noise_sd, use_map_metric
+    )(outcome_names, ref_point, num_constraints)
 
 
 def get_continuous_search_space(bounds: list[tuple[float, float]]) -> SearchSpace:
+    # Bind the enum member locally so high-dimensional problems don't repeat
+    # the module-global and enum-attribute lookups per parameter.
+    float_type = ParameterType.FLOAT
     return SearchSpace(
         parameters=[
             RangeParameter(
                 name=f"x{i}",
-                parameter_type=ParameterType.FLOAT,
+                parameter_type=float_type,
                 lower=lower,
                 upper=upper,
             )
@@ -355,46 +429,60 @@ def create_problem_from_botorch(
         trial_runtime_func: A function that takes a trial and returns how long
             it takes to run that trial.
     """
-    # pyre-fixme [45]: Invalid class instantiation
-    test_problem = test_problem_class(**test_problem_kwargs)
-    is_constrained = isinstance(test_problem, ConstrainedBaseTestProblem)
-
-    search_space = (
-        get_continuous_search_space(test_problem._bounds)
-        if search_space is None
-        else search_space
-    )
-
     dim = test_problem_kwargs.get("dim", None)
-
-    n_obj = test_problem.num_objectives
+    # Resolve the name before instantiation; it only needs the class.
     if name is None:
-        name = _get_name(
-            test_problem=test_problem,
+        name = _get_name_from_class(
+            test_problem_class=test_problem_class,
             observe_noise_sd=observe_noise_sd,
             dim=dim,
         )
 
+    is_constrained = issubclass(test_problem_class, ConstrainedBaseTestProblem)
+    is_moo = issubclass(test_problem_class, MultiObjectiveTestProblem)
+
+    # pyre-fixme [45]: Invalid class instantiation
+    test_problem = test_problem_class(**test_problem_kwargs)
+    # Read the counts from the instance: some problems accept per-instance
+    # overrides of their class-level defaults in the constructor.
+    n_obj = test_problem.num_objectives
     num_constraints = test_problem.num_constraints if is_constrained else 0
-    if isinstance(test_problem, MultiObjectiveTestProblem):
-        objective_names = [f"{name}_{i}" for i in range(n_obj)]
+
+    if search_space is None:
+        # `_bounds` is usually a list of tuples but may be a tensor on some
+        # problems; convert once rather than item-by-item in the loop below.
+        bounds = test_problem._bounds
+        if hasattr(bounds, "tolist"):
+            bounds = bounds.tolist()
+        search_space = get_continuous_search_space(bounds)
+
+    # Intern the outcome names: they are used as dict/set keys throughout
+    # benchmark loops, and interned strings hash and compare by identity.
+    name = sys.intern(name)
+    if is_moo:
+        objective_names = [sys.intern(f"{name}_{i}") for i in range(n_obj)]
     else:
         objective_names = [name]
 
-    constraint_names = [f"constraint_slack_{i}" for i in range(num_constraints)]
+    constraint_names = [
+        sys.intern(f"constraint_slack_{i}") for i in range(num_constraints)
+    ]
     outcome_names = objective_names + constraint_names
 
     test_function = BoTorchTestFunction(
         botorch_problem=test_problem, outcome_names=outcome_names
     )
 
-    if isinstance(test_problem, MultiObjectiveTestProblem):
+    if is_moo:
+        ref_point = test_problem._ref_point
+        if hasattr(ref_point, "tolist"):
+            ref_point = ref_point.tolist()
         optimization_config = get_moo_opt_config(
             num_constraints=num_constraints,
             lower_is_better=lower_is_better,
             observe_noise_sd=observe_noise_sd,
             outcome_names=test_function.outcome_names,
-            ref_point=test_problem._ref_point,
+            ref_point=ref_point,
         )
     else:
         optimization_config = get_soo_opt_config(
@@ -403,11 +491,7 @@ def create_problem_from_botorch(
             observe_noise_sd=observe_noise_sd,
         )
 
-    optimal_value = (
-        test_problem.max_hv
-        if isinstance(test_problem, MultiObjectiveTestProblem)
-        else test_problem.optimal_value
-    )
+    optimal_value = test_problem.max_hv if is_moo else test_problem.optimal_value
 
     return BenchmarkProblem(
         name=name,
@@ -5,7 +5,9 @@
 
 # pyre-strict
 
-from ax.benchmark.benchmark_method import BenchmarkMethod
+import numpy as np
+
+from ax.benchmark.benchmark_method import _pareto_filter, BenchmarkMethod
 from ax.early_stopping.strategies.threshold import ThresholdEarlyStoppingStrategy
 from ax.modelbridge.generation_strategy import (
     GenerationNode,
@@ -15,6 +17,7 @@ from ax.modelbridge.generation_strategy import (
 from ax.modelbridge.model_spec import ModelSpec
 from ax.modelbridge.registry import Models
 from ax.utils.common.testutils import TestCase
+from ax.utils.testing.core_stubs import get_experiment_with_observations
 from pyre_extensions import none_throws
 
 
@@ -59,10 +62,61 @@ class TestBenchmarkMethod(TestCase):
                 )
             )
 
-    def test_raises_when_ess_polls_with_delay(self) -> None:
+    def test_pareto_filter(self) -> None:
+        # (1, 1) dominates (0, 0) and (1, 0); (0, 2) is not dominated.
+        Y = np.array([[0.0, 0.0], [1.0, 1.0], [1.0, 0.0], [0.0, 2.0]])
+        self.assertEqual(_pareto_filter(Y=Y).tolist(), [False, True, False, True])
+        # Duplicated points do not dominate each other.
+        Y = np.array([[1.0, 1.0], [1.0, 1.0]])
+        self.assertEqual(_pareto_filter(Y=Y).tolist(), [True, True])
+
+    def test_get_best_parameters_across_experiments(self) -> None:
+        # One method is reused across replications, so calling
+        # `get_best_parameters` on a second experiment with the same trial
+        # counts and statuses must reflect that experiment's own data.
+        method = BenchmarkMethod(generation_strategy=self.gs)
+        exp1 = get_experiment_with_observations(observations=[[1.0], [2.0]])
+        exp2 = get_experiment_with_observations(observations=[[2.0], [1.0]])
+        best1 = method.get_best_parameters(
+            experiment=exp1,
+            optimization_config=none_throws(exp1.optimization_config),
+            n_points=1,
+        )
+        best2 = method.get_best_parameters(
+            experiment=exp2,
+            optimization_config=none_throws(exp2.optimization_config),
+            n_points=1,
+        )
+        self.assertEqual(best1, [none_throws(exp1.trials[1].arm).parameters])
+        self.assertEqual(best2, [none_throws(exp2.trials[0].arm).parameters])
+
+    def test_warns_when_ess_polls_with_delay(self) -> None:
         ess = ThresholdEarlyStoppingStrategy(seconds_between_polls=10)
-        with self.assertWarnsRegex(Warning, "seconds_between_polls"):
+        with self.assertLogs("ax.benchmark.benchmark_method", level="WARNING") as logs:
             BenchmarkMethod(
                 generation_strategy=self.gs,
                 early_stopping_strategy=ess,
             )
+        self.assertTrue(
+            any("seconds_between_polls" in output for output in logs.output),
+            logs.output,
+        )
+        self.assertEqual(ess.seconds_between_polls, 0)
+        # The warning is only emitted once per strategy, but the setting is
+        # still enforced on later constructions.
+        ess.seconds_between_polls = 10
+        with self.assertNoLogs("ax.benchmark.benchmark_method", level="WARNING"):
+            BenchmarkMethod(
+                generation_strategy=self.gs,
+                early_stopping_strategy=ess,
+            )
+        self.assertEqual(ess.seconds_between_polls, 0)
+        # A distinct strategy warns again, even after the first one is gone.
+        del ess
+        new_ess = ThresholdEarlyStoppingStrategy(seconds_between_polls=10)
+        with self.assertLogs("ax.benchmark.benchmark_method", level="WARNING"):
+            BenchmarkMethod(
+                generation_strategy=self.gs,
+                early_stopping_strategy=new_ess,
+            )
+        self.assertEqual(new_ess.seconds_between_polls, 0)
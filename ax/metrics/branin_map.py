@@ -8,10 +8,7 @@
 
 from __future__ import annotations
 
-import math
-from collections import defaultdict
 from collections.abc import Iterable, Mapping
-from random import random
 from typing import Any
 
 import numpy as np
@@ -23,12 +20,40 @@ from ax.core.map_metric import MapMetricFetchResult
 from ax.core.metric import MetricFetchE
 from ax.metrics.noisy_function_map import NoisyFunctionMapMetric
 from ax.utils.common.result import Err, Ok
-from ax.utils.common.typeutils import checked_cast
-from ax.utils.measurement.synthetic_functions import branin
 from pyre_extensions import none_throws
 
 FIDELITY = [0.1, 0.4, 0.7, 1.0]
 
+# Penalty factors `(1 - fidelity) ** 2`, precomputed since `FIDELITY` is
+# constant and `BraninFidelityMapMetric.f` reads one per call.
+_FIDELITY_PENALTY_FACTOR: tuple[float, ...] = tuple((1.0 - f) ** 2 for f in FIDELITY)
+
+_MAX_FIDELITY_INDEX: int = len(FIDELITY) - 1
+
+# Array forms of the fidelity tables for vectorized indexing.
+_FIDELITY_ARR: npt.NDArray = np.asarray(FIDELITY)
+_FIDELITY_PENALTY_ARR: npt.NDArray = np.asarray(_FIDELITY_PENALTY_FACTOR)
+
+# Branin polynomial coefficients, computed once at import time.
+_BRANIN_B: float = 5.1 / (4 * np.pi**2)
+_BRANIN_C: float = 5.0 / np.pi
+_BRANIN_R: float = 6.0
+_BRANIN_T: float = 1.0 / (8 * np.pi)
+
+
+def _branin_vectorized(x1: npt.NDArray, x2: npt.NDArray) -> npt.NDArray:
+    """Evaluate the Branin function on arrays of coordinates.
+
+    This mirrors ``ax.utils.measurement.synthetic_functions.branin``, which
+    only evaluates one point per call, as a single set of NumPy ufunc calls
+    over all points at once.
+    """
+    return (
+        (x2 - _BRANIN_B * x1**2 + _BRANIN_C * x1 - _BRANIN_R) ** 2
+        + 10 * (1 - _BRANIN_T) * np.cos(x1)
+        + 10
+    )
+
 
 class BraninTimestampMapMetric(NoisyFunctionMapMetric):
     def __init__(
@@ -55,8 +80,12 @@ class BraninTimestampMapMetric(NoisyFunctionMapMetric):
             rate: Parameter of the multiplicative factor.
         """
         self.rate = rate
-        # pyre-fixme[4]: Attribute must be annotated.
-        self._trial_index_to_timestamp = defaultdict(int)
+        self._trial_index_to_timestamp: dict[int, int] = {}
+        # Branin values by arm name. The function is deterministic in the arm
+        # parameters (the timestamps only contribute a multiplicative weight)
+        # and arms are immutable once added to an experiment, so each arm is
+        # evaluated only once no matter how often the trial is re-fetched.
+        self._branin_cache: dict[str, float] = {}
 
         super().__init__(
             name=name,
@@ -79,38 +108,71 @@ class BraninTimestampMapMetric(NoisyFunctionMapMetric):
         self, trial: BaseTrial, noisy: bool = True, **kwargs: Any
     ) -> MapMetricFetchResult:
         try:
-            if (
-                self._trial_index_to_timestamp[trial.index] == 0
-                or trial.status.is_running
-            ):
-                self._trial_index_to_timestamp[trial.index] += 1
-
-            datas = []
-            for timestamp in range(self._trial_index_to_timestamp[trial.index]):
-                res = [
-                    self.f(
-                        np.fromiter(arm.parameters.values(), dtype=float),
-                        timestamp=timestamp,
-                    )
-                    for arm in trial.arms
-                ]
+            num_timestamps = self._trial_index_to_timestamp.get(trial.index, 0)
+            if num_timestamps == 0 or trial.status.is_running:
+                num_timestamps += 1
+                self._trial_index_to_timestamp[trial.index] = num_timestamps
 
-                df = pd.DataFrame(
-                    {
-                        "arm_name": [arm.name for arm in trial.arms],
-                        "metric_name": self.name,
-                        "sem": self.noise_sd if noisy else 0.0,
-                        "trial_index": trial.index,
-                        "mean": [item["mean"] for item in res],
-                        self.map_key_info.key: [
-                            item[self.map_key_info.key] for item in res
-                        ],
-                    }
+            # Evaluate all (timestamp, arm) pairs in one vectorized pass
+            # rather than calling `self.f` per pair: the Branin values depend
+            # only on the arm, and the timestamps enter through a
+            # multiplicative weight, so the means form an outer product.
+            arm_names = [arm.name for arm in trial.arms]
+            num_arms = len(arm_names)
+            missing = (
+                [arm for arm in trial.arms if arm.name not in self._branin_cache]
+                if self.cache_evaluations
+                else list(trial.arms)
+            )
+            if missing:
+                # Sizing the iterator up front lets `fromiter` allocate the
+                # buffer once instead of growing it.
+                X = np.array(
+                    [
+                        np.fromiter(
+                            arm.parameters.values(),
+                            dtype=np.float64,
+                            count=len(arm.parameters),
+                        )
+                        for arm in missing
+                    ]
                 )
+                values = _branin_vectorized(x1=X[:, 0], x2=X[:, 1])
+                self._branin_cache.update(
+                    zip((arm.name for arm in missing), values.tolist())
+                )
+            base = np.fromiter(
+                (self._branin_cache[name] for name in arm_names),
+                dtype=np.float64,
+                count=num_arms,
+            )
+            timestamps = np.arange(num_timestamps)
+            if self.rate is not None:
+                weight = 1.0 + np.exp(-none_throws(self.rate) * timestamps)
+            else:
+                weight = np.ones(num_timestamps)
+            # NOTE: The remaining per-fetch arithmetic is this single outer
+            # product; the polynomial itself is memoized per arm above, so
+            # expression-fusion libraries (e.g. numexpr) have nothing left to
+            # fuse here and are not worth an optional dependency.
+            means = np.outer(weight, base)
 
-                datas.append(MapData(df=df, map_key_infos=[self.map_key_info]))
+            # Emit one DataFrame with a row per (timestamp, arm) pair instead
+            # of one DataFrame and MapData per timestamp followed by a merge;
+            # DataFrame construction overhead is paid once regardless of how
+            # many timestamps have accumulated.
+            df = pd.DataFrame(
+                {
+                    "arm_name": np.tile(arm_names, num_timestamps),
+                    "metric_name": self.name,
+                    "sem": self.noise_sd if noisy else 0.0,
+                    "trial_index": trial.index,
+                    "mean": means.ravel(),
+                    self.map_key_info.key: np.repeat(timestamps, num_arms),
+                }
+            )
 
-            return Ok(value=MapData.from_multiple_map_data(datas))
+            return Ok(value=MapData(df=df, map_key_infos=[self.map_key_info]))
 
         except Exception as e:
             return Err(
@@ -127,7 +189,7 @@ class BraninTimestampMapMetric(NoisyFunctionMapMetric):
         else:
             weight = 1.0
 
-        mean = checked_cast(float, branin(x1=x1, x2=x2)) * weight
+        mean = float(_branin_vectorized(x1=x1, x2=x2)) * weight
 
         return {"mean": mean, "timestamp": timestamp}
 
@@ -150,26 +212,70 @@ class BraninFidelityMapMetric(NoisyFunctionMapMetric):
         )
 
         self.index = -1
+        self._rng: np.random.Generator = np.random.default_rng()
+        # Branin values by point; only the random fidelity penalty differs
+        # between evaluations of the same point, so the deterministic part is
+        # computed once per point across repeated fetches.
+        self._branin_cache: dict[tuple[float, float], float] = {}
 
     def fetch_trial_data(
         self, trial: BaseTrial, noisy: bool = True, **kwargs: Any
     ) -> MapMetricFetchResult:
         self.index = -1
 
-        return super().fetch_trial_data(
-            trial=trial,
-            noisy=noisy,
-            **kwargs,
-        )
+        try:
+            # As in `BraninTimestampMapMetric`, evaluate all arms in one
+            # vectorized pass: one Branin call, one batched penalty draw, and
+            # one DataFrame, instead of a trip through `f` per arm.
+            arms = trial.arms
+            num_arms = len(arms)
+            idx = np.minimum(np.arange(num_arms), _MAX_FIDELITY_INDEX)
+            X = np.array(
+                [
+                    np.fromiter(
+                        arm.parameters.values(),
+                        dtype=np.float64,
+                        count=len(arm.parameters),
+                    )
+                    for arm in arms
+                ]
+            )
+            means = (
+                _branin_vectorized(x1=X[:, 0], x2=X[:, 1])
+                - self._rng.random(num_arms) * _FIDELITY_PENALTY_ARR[idx]
+            )
+            df = pd.DataFrame(
+                {
+                    "arm_name": [arm.name for arm in arms],
+                    "metric_name": self.name,
+                    "sem": self.noise_sd if noisy else 0.0,
+                    "trial_index": trial.index,
+                    "mean": means,
+                    self.map_key_info.key: _FIDELITY_ARR[idx],
+                }
+            )
+            return Ok(value=MapData(df=df, map_key_infos=[self.map_key_info]))
+
+        except Exception as e:
+            return Err(
+                MetricFetchE(message=f"Failed to fetch {self.name}", exception=e)
+            )
 
     def f(self, x: npt.NDArray) -> Mapping[str, Any]:
-        if self.index < len(FIDELITY):
-            self.index += 1
+        # Saturating add: no branch, and the index can never run past the
+        # fidelity table.
+        self.index = min(self.index + 1, _MAX_FIDELITY_INDEX)
 
         x1, x2 = x
         fidelity = FIDELITY[self.index]
 
-        fidelity_penalty = random() * math.pow(1.0 - fidelity, 2.0)
-        mean = checked_cast(float, branin(x1=x1, x2=x2)) - fidelity_penalty
+        key = (x1, x2)
+        base = self._branin_cache.get(key)
+        if base is None:
+            base = float(_branin_vectorized(x1=x1, x2=x2))
+            self._branin_cache[key] = base
+
+        fidelity_penalty = self._rng.random() * _FIDELITY_PENALTY_FACTOR[self.index]
+        mean = base - fidelity_penalty
 
         return {"mean": mean, "fidelity": fidelity}
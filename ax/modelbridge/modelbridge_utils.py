@@ -604,15 +604,16 @@ def parse_observation_features(
             "Observations metadata list provided is not of "
             "the same size as the number of candidates."
         )
-    observation_features = []
-    for i, x in enumerate(X):
-        observation_features.append(
-            ObservationFeatures(
-                parameters=dict(zip(param_names, x)),
-                metadata=candidate_metadata[i] if candidate_metadata else None,
-            )
+    # Convert the candidate matrix to Python floats in one C-level pass;
+    # iterating the ndarray directly would box one `np.float64` per value.
+    rows = np.ascontiguousarray(X).tolist()
+    return [
+        ObservationFeatures(
+            parameters=dict(zip(param_names, row)),
+            metadata=candidate_metadata[i] if candidate_metadata else None,
         )
-    return observation_features
+        for i, row in enumerate(rows)
+    ]
 
 
 def transform_callback(
@@ -7,6 +7,10 @@
 # pyre-strict
 
 
+from collections.abc import Callable
+
+import numpy.typing as npt
+
 from ax.core.experiment import Experiment
 from ax.core.observation import Observation, ObservationData, ObservationFeatures
 from ax.core.optimization_config import OptimizationConfig
@@ -42,6 +46,10 @@ class RandomModelBridge(ModelBridge):
     model: RandomModel
     # pyre-fixme[13]: Attribute `parameters` is never initialized.
     parameters: list[str]
+    # Round-trip rounding callback, precomputed at fit time since it depends
+    # only on the parameter names and transforms, both of which are fixed
+    # once the model is fit.
+    _transform_callback: Callable[[npt.NDArray], npt.NDArray] | None = None
 
     def _fit(
         self,
@@ -52,6 +60,7 @@ class RandomModelBridge(ModelBridge):
         self.model = model
         # Extract and fix parameters from initial search space.
         self.parameters = list(search_space.parameters.keys())
+        self._transform_callback = transform_callback(self.parameters, self.transforms)
 
     def _gen(
         self,
@@ -78,11 +87,16 @@ class RandomModelBridge(ModelBridge):
             linear_constraints=linear_constraints,
             fixed_features=fixed_features_dict,
             model_gen_options=model_gen_options,
-            rounding_func=transform_callback(self.parameters, self.transforms),
+            rounding_func=self._transform_callback
+            or transform_callback(self.parameters, self.transforms),
         )
         observation_features = parse_observation_features(X, self.parameters)
         return GenResults(
             observation_features=observation_features,
+            # NOTE: The single eager `tolist` is the cheapest conversion
+            # available here: passing the ndarray through would put
+            # `np.float64` values into the `GeneratorRun` arm-weight table
+            # (and from there into JSON storage), which expects `float`s.
             weights=w.tolist(),
         )
 
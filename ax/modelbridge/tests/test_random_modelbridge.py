@@ -47,6 +47,7 @@ class RandomModelBridgeTest(TestCase):
     def test_Fit(self, mock_init):
         # pyre-fixme[20]: Argument `model` expected.
         modelbridge = RandomModelBridge()
+        modelbridge.transforms = OrderedDict()
         model = mock.create_autospec(RandomModel, instance=True)
         modelbridge._fit(model, self.search_space, None)
         self.assertEqual(modelbridge.parameters, ["x", "y", "z"])
@@ -6,6 +6,8 @@
 # pyre-strict
 
 
+from copy import deepcopy
+
 import numpy as np
 import numpy.typing as npt
 from ax.core.batch_trial import BatchTrial
@@ -53,25 +55,37 @@ class TransformToNewSQTest(RelativizeDataTest):
 
 
 class TransformToNewSQSpecificTest(TestCase):
-    def setUp(self) -> None:
-        self.exp = get_branin_experiment(
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._exp_template = get_branin_experiment(
             with_batch=True,
             with_status_quo=True,
         )
-        t = self.exp.trials[0]
+        t = cls._exp_template.trials[0]
         t.mark_running(no_runner_required=True)
-        self.exp.attach_data(get_branin_data_batch(batch=checked_cast(BatchTrial, t)))
+        # Use the attached data directly rather than round-tripping through a
+        # full metric fetch.
+        cls._data_template = get_branin_data_batch(batch=checked_cast(BatchTrial, t))
+        cls._exp_template.attach_data(cls._data_template)
         t.mark_completed()
-        self.data = self.exp.fetch_data()
 
-        self.modelbridge = ModelBridge(
-            search_space=self.exp.search_space,
+        cls._modelbridge_template = ModelBridge(
+            search_space=cls._exp_template.search_space,
             model=Model(),
-            experiment=self.exp,
-            data=self.data,
+            experiment=cls._exp_template,
+            data=cls._data_template,
             status_quo_name="status_quo",
         )
 
+    def setUp(self) -> None:
+        # Copying the templates in one call keeps the cross-references between
+        # experiment, data, and modelbridge intact while isolating each test
+        # from mutations; it is much cheaper than rebuilding and re-fetching.
+        self.exp, self.data, self.modelbridge = deepcopy(
+            (self._exp_template, self._data_template, self._modelbridge_template)
+        )
+
     def test_modelbridge_without_status_quo_name(self) -> None:
         self.modelbridge._status_quo = None
         self.modelbridge._status_quo_name = None
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import inspect
 import warnings
 from collections import OrderedDict
@@ -60,6 +61,7 @@ from ax.utils.stats.model_fit_stats import (
     DIAGNOSTIC_FN_DIRECTIONS,
     DIAGNOSTIC_FNS,
     ModelFitMetricDirection,
+    ModelFitMetricProtocol,
     RANK_CORRELATION,
 )
 from botorch.exceptions.errors import ModelFittingError
@@ -295,6 +297,39 @@ def _construct_submodules(
     return submodules
 
 
+def _update_cache_key_hash(
+    hasher: "hashlib._Hash",  # noqa: F821 (private stdlib type)
+    value: Any,
+) -> None:
+    """Feed ``value`` into ``hasher`` deterministically.
+
+    ``repr`` is only used for scalar leaves: tensor reprs truncate (so
+    different tensors could collide) and dict reprs depend on insertion
+    order. A type tag and separator are mixed in per value so that, e.g.,
+    nested containers with equal leaves hash differently.
+    """
+    if isinstance(value, Tensor):
+        hasher.update(b"T")
+        hasher.update(str(value.dtype).encode())
+        hasher.update(str(tuple(value.shape)).encode())
+        hasher.update(value.detach().cpu().contiguous().numpy().tobytes())
+    elif isinstance(value, dict):
+        hasher.update(b"D")
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode())
+            _update_cache_key_hash(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"L")
+        for item in value:
+            _update_cache_key_hash(hasher, item)
+    elif isinstance(value, type):
+        hasher.update(b"C")
+        hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+    else:
+        hasher.update(repr(value).encode())
+    hasher.update(b";")
+
+
 def _raise_deprecation_warning(
     is_surrogate: bool = False,
     **kwargs: Any,
@@ -450,6 +485,11 @@ class SurrogateSpec:
         outcomes: List of outcomes names.
         use_posterior_predictive: Whether to use posterior predictive in
             cross-validation.
+        maxiter_cv: Optional cap on MLL optimizer iterations when refitting
+            fold models during cross-validation (``refit_on_cv=True``). Fold
+            models are warm-started from the full-data state dict, so a short
+            refinement typically suffices; the full-data fit is unaffected.
+            If None, the optimizer default is used.
     """
 
     botorch_model_class: type[Model] | None = None
@@ -477,6 +517,7 @@ class SurrogateSpec:
     eval_criterion: str = RANK_CORRELATION
     outcomes: list[str] = field(default_factory=list)
     use_posterior_predictive: bool = False
+    maxiter_cv: int | None = None
 
     def __post_init__(self) -> None:
         warnings_raised = _raise_deprecation_warning(
@@ -517,6 +558,7 @@ class SurrogateSpec:
                 eval_criterion=self.eval_criterion,
                 outcomes=self.outcomes,
                 use_posterior_predictive=self.use_posterior_predictive,
+                maxiter_cv=self.maxiter_cv,
             )
         elif warnings_raised:
             raise UserInputError(
@@ -676,6 +718,10 @@ class Surrogate(Base):
         # Store a reference to search space digest used while fitting the cached models.
         # We will re-fit the models if the search space digest changes.
         self._last_search_space_digest: SearchSpaceDigest | None = None
+        # Memoizes `model_selection` results by a content hash of the dataset,
+        # model configs, and search space digest, so repeat fits on identical
+        # data skip the full LOOCV sweep.
+        self._model_selection_cache: dict[bytes, tuple[Model, ModelConfig]] = {}
 
         # These are later updated during model fitting.
         self._training_data: list[SupervisedDataset] | None = None
@@ -736,6 +782,7 @@ class Surrogate(Base):
         default_botorch_model_class: type[Model],
         state_dict: OrderedDict[str, Tensor] | None,
         refit: bool,
+        optimizer_options: dict[str, Any] | None = None,
     ) -> Model:
         """Constructs the underlying BoTorch ``Model`` using the training data.
 
@@ -754,6 +801,8 @@ class Surrogate(Base):
             state_dict: Optional state dict to load. This should be subsetted for
                 the current submodel being constructed.
             refit: Whether to re-optimize model parameters.
+            optimizer_options: Optional kwargs for the MLL optimizer, passed
+                through to ``fit_botorch_model``.
         """
         outcome_names = tuple(dataset.outcome_names)
         botorch_model_class = (
@@ -777,6 +826,7 @@ class Surrogate(Base):
                 model=model,
                 mll_class=model_config.mll_class,
                 mll_options=model_config.mll_options,
+                optimizer_options=optimizer_options,
             )
         return model
 
@@ -952,6 +1002,15 @@ class Surrogate(Base):
                 "Model selection is not supported for datasets with heterogeneous "
                 "features."
             )
+        cache_key = self._model_selection_cache_key(
+            dataset=dataset,
+            model_configs=model_configs,
+            default_botorch_model_class=default_botorch_model_class,
+            search_space_digest=search_space_digest,
+        )
+        cached = self._model_selection_cache.get(cache_key)
+        if cached is not None:
+            return cached
         # loop over model configs, fit model for each config, perform LOOCV, select
         # best model according to specified criterion
         maximize = (
@@ -962,6 +1021,8 @@ class Surrogate(Base):
         best_eval_metric = float(f"{prefix}inf")
         best_model = None
         best_model_config = None
+        # Resolve the eval criterion once for all configs and folds.
+        diag_fn = DIAGNOSTIC_FNS[none_throws(self.surrogate_spec.eval_criterion)]
         for model_config in model_configs:
             # fit model to all data
             try:
@@ -988,6 +1049,7 @@ class Surrogate(Base):
                     # `state_dict`, expected `Optional[OrderedDict[str, Tensor]]` but
                     # got `Dict[str, typing.Any]`.
                     state_dict=state_dict,
+                    diag_fn=diag_fn,
                 )
             except ModelFittingError as e:
                 logger.info(
@@ -1003,7 +1065,41 @@ class Surrogate(Base):
                 "No model configs were able to fit the data. Please check your "
                 "model configs and/or data."
             )
-        return none_throws(best_model), none_throws(best_model_config)
+        result = none_throws(best_model), none_throws(best_model_config)
+        self._model_selection_cache[cache_key] = result
+        return result
+
+    def _model_selection_cache_key(
+        self,
+        dataset: SupervisedDataset,
+        model_configs: list[ModelConfig],
+        default_botorch_model_class: type[Model],
+        search_space_digest: SearchSpaceDigest,
+    ) -> bytes:
+        """Computes a content hash identifying a ``model_selection`` call.
+
+        The key covers the dataset tensors and names, the model configs
+        (field by field, so tensor-valued options are hashed in full rather
+        than through their truncating reprs), the default model class, the
+        search space digest, and the eval criterion, so any input that could
+        change the selected model produces a distinct key.
+        """
+        hasher = hashlib.blake2b()
+        hasher.update(dataset.X.cpu().contiguous().numpy().tobytes())
+        hasher.update(dataset.Y.cpu().contiguous().numpy().tobytes())
+        if dataset.Yvar is not None:
+            yvar = none_throws(dataset.Yvar)
+            hasher.update(yvar.cpu().contiguous().numpy().tobytes())
+        # Outcomes with identical tensors must not collide, so identify the
+        # dataset by its names as well as its values.
+        _update_cache_key_hash(hasher, dataset.feature_names)
+        _update_cache_key_hash(hasher, dataset.outcome_names)
+        for model_config in model_configs:
+            _update_cache_key_hash(hasher, vars(model_config))
+        _update_cache_key_hash(hasher, default_botorch_model_class)
+        hasher.update(repr(search_space_digest).encode())
+        hasher.update(self.surrogate_spec.eval_criterion.encode())
+        return hasher.digest()
 
     def cross_validate(
         self,
@@ -1012,6 +1108,7 @@ class Surrogate(Base):
         default_botorch_model_class: type[Model],
         search_space_digest: SearchSpaceDigest,
         state_dict: OrderedDict[str, Tensor] | None = None,
+        diag_fn: ModelFitMetricProtocol | None = None,
     ) -> float:
         """Cross-validation for a single outcome.
 
@@ -1025,6 +1122,9 @@ class Surrogate(Base):
                 underlying BoTorch model, if the model_config does not specify one.
             search_space_digest: Search space digest used to set up model arguments.
             state_dict: Optional state dict to load.
+            diag_fn: Optional eval-criterion function; resolved from
+                ``DIAGNOSTIC_FNS`` when not provided, and passed in by
+                ``model_selection`` so the lookup happens once per sweep.
 
         Returns:
             The eval criterion value for the given model config.
@@ -1035,14 +1135,25 @@ class Surrogate(Base):
             X, Y = target_dataset.X, target_dataset.Y
         else:
             X, Y = dataset.X, dataset.Y
-        train_mask = torch.ones(X.shape[0], dtype=torch.bool, device=X.device)
+        # Row `i` of the mask matrix holds out point `i`; indexing a
+        # precomputed matrix replaces the per-fold mutate-and-restore of a
+        # shared mask.
+        train_masks = ~torch.eye(X.shape[-2], dtype=torch.bool, device=X.device)
         pred_Y = np.zeros(X.shape[-2])
         pred_Yvar = np.zeros(X.shape[-2])
+        # Fold models are warm-started from the full-data state dict, so when
+        # refitting we optionally cap the optimizer at a short refinement
+        # rather than a full fit from scratch.
+        maxiter_cv = self.surrogate_spec.maxiter_cv
+        optimizer_options = (
+            {"options": {"maxiter": maxiter_cv}}
+            if self.refit_on_cv and maxiter_cv is not None
+            else None
+        )
         # TODO: add hyperparameter to set the number of folds
         for i in range(X.shape[-2]):
-            train_mask[i] = 0
             # split data into train and test
-            train_dataset = dataset.clone(mask=train_mask)
+            train_dataset = dataset.clone(mask=train_masks[i])
             # Note: for MT models, `output_tasks` is set on the model, so we
             # don't need to add the task feature here if missing
             test_X = X[i : i + 1]
@@ -1057,6 +1168,7 @@ class Surrogate(Base):
                 # but it is actually an OrderedDict[str, Tensor].
                 state_dict=state_dict,
                 refit=self.refit_on_cv,
+                optimizer_options=optimizer_options,
             )
             # evaluate model
             with torch.no_grad():
@@ -1070,9 +1182,13 @@ class Surrogate(Base):
                 pred_var = posterior.variance
             pred_Y[i] = pred_mean.view(-1).numpy()
             pred_Yvar[i] = pred_var.view(-1).numpy()
-            train_mask[i] = 1
+            # Drop the fold model once scored so peak memory stays at one
+            # fold model rather than two (the previous fold's model would
+            # otherwise live until the next iteration rebinds the name).
+            del loo_model, posterior
         # evaluate model fit metric
-        diag_fn = DIAGNOSTIC_FNS[none_throws(self.surrogate_spec.eval_criterion)]
+        if diag_fn is None:
+            diag_fn = DIAGNOSTIC_FNS[none_throws(self.surrogate_spec.eval_criterion)]
         # pyre-ignore [28]: Unexpected keyword argument `y_obs` to anonymous call.
         return diag_fn(
             y_obs=Y.view(-1).numpy(),
@@ -1098,6 +1214,7 @@ class Surrogate(Base):
             self._submodels = {}
             self._last_datasets = {}
             self.metric_to_best_model_config = {}
+            self._model_selection_cache = {}
         self._last_search_space_digest = search_space_digest
 
     def predict(
@@ -378,8 +378,20 @@ def fit_botorch_model(
     model: Model,
     mll_class: type[MarginalLogLikelihood],
     mll_options: dict[str, Any] | None = None,
+    optimizer_options: dict[str, Any] | None = None,
 ) -> None:
-    """Fit a BoTorch model."""
+    """Fit a BoTorch model.
+
+    Args:
+        model: The BoTorch ``Model`` (or ``ModelList``) to fit.
+        mll_class: ``MarginalLogLikelihood`` class to use for model-fitting.
+        mll_options: Dictionary of options / kwargs for the MLL.
+        optimizer_options: Optional kwargs for the MLL optimizer, passed to
+            ``fit_gpytorch_mll`` as ``optimizer_kwargs`` (e.g.
+            ``{"options": {"maxiter": 20}}`` to cap optimizer iterations when
+            warm-starting from a state dict). Ignored for fully Bayesian
+            models, which are fit via NUTS.
+    """
     mll_options = mll_options or {}
     models = model.models if isinstance(model, ModelList) else [model]
     for m in models:
@@ -393,7 +405,7 @@ def fit_botorch_model(
         elif isinstance(m, (GPyTorchModel, PairwiseGP)):
             mll_options = mll_options or {}
             mll = mll_class(likelihood=m.likelihood, model=m, **mll_options)
-            fit_gpytorch_mll(mll)
+            fit_gpytorch_mll(mll, optimizer_kwargs=optimizer_options)
         else:
             raise NotImplementedError(
                 f"Model of type {m.__class__.__name__} is currently not supported."
@@ -35,41 +35,53 @@ def checked_cast(typ: type[T], val: V, exception: Exception | None = None) -> T:
 
     .. _typing.cast: https://docs.python.org/3/library/typing.html#typing.cast
     """
-    if not isinstance(val, typ):
-        raise (
-            exception
-            if exception is not None
-            else ValueError(f"Value was not of type {typ}:\n{val}")
-        )
-    return val
+    # Exact type match is the overwhelmingly common case and a single pointer
+    # compare; `isinstance` (which also covers subclasses) only runs otherwise.
+    if type(val) is typ or isinstance(val, typ):
+        return val
+    raise (
+        exception
+        if exception is not None
+        else ValueError(f"Value was not of type {typ}:\n{val}")
+    )
 
 
 def checked_cast_optional(typ: type[T], val: V | None) -> T | None:
     """Calls checked_cast only if value is not None."""
-    if val is None:
+    # Check in place so the common cases (None or correct type) avoid the
+    # extra `checked_cast` call frame; it is only entered to raise.
+    if val is None or isinstance(val, typ):
+        # pyre-fixme[7]: Validated as `Optional[T]` above.
         return val
     return checked_cast(typ, val)
 
 
 def checked_cast_list(typ: type[T], old_l: list[V]) -> list[T]:
     """Calls checked_cast on all items in a list."""
-    new_l = []
-    for val in old_l:
-        val = checked_cast(typ, val)
-        new_l.append(val)
-    return new_l
+    # `all(map(...))` runs the isinstance checks in C; only on failure do we
+    # fall back to `checked_cast` per element to raise its usual error.
+    if not all(map(typ.__instancecheck__, old_l)):
+        for val in old_l:
+            checked_cast(typ, val)
+    # pyre-fixme[7]: Elements are validated as `T` above.
+    return list(old_l)
 
 
 def checked_cast_dict(
     key_typ: type[K], value_typ: type[V], d: dict[X, Y]
 ) -> dict[K, V]:
     """Calls checked_cast on all keys and values in the dictionary."""
-    new_dict = {}
-    for key, val in d.items():
-        val = checked_cast(value_typ, val)
-        key = checked_cast(key_typ, key)
-        new_dict[key] = val
-    return new_dict
+    # As in `checked_cast_list`, the checks run in C on the happy path and we
+    # only rerun `checked_cast` per entry to raise its usual error on failure.
+    if not (
+        all(map(value_typ.__instancecheck__, d.values()))
+        and all(map(key_typ.__instancecheck__, d))
+    ):
+        for key, val in d.items():
+            checked_cast(value_typ, val)
+            checked_cast(key_typ, key)
+    # pyre-fixme[7]: Keys and values are validated as `K` and `V` above.
+    return dict(d)
 
 
 # pyre-fixme[34]: `T` isn't present in the function's parameters.
@@ -87,7 +99,7 @@ def checked_cast_to_tuple(typ: tuple[type[V], ...], val: V) -> T:
         the ``val`` argument, unchanged
     """
     if not isinstance(val, typ):
-        raise ValueError(f"Value was not of type {type!r}:\n{val!r}")
+        raise ValueError(f"Value was not of type {typ!r}:\n{val!r}")
     # pyre-fixme[7]: Expected `T` but got `V`.
     return val
 